@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.app.use_cases.collect_batch import CollectBatchUseCase, TextQuerySpec, split_types
+from src.app.use_cases.collect_places import CollectPlacesUseCase
+from src.app.use_cases.enrich_emails import EnrichEmailsUseCase
+from src.core.entities import Place
+from src.core.errors import JobCancelled
+from src.core.ports import EmailScraper, PlaceRepository, PlacesProvider, ProgressFn
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+FINISHED = {DONE, FAILED, CANCELLED}
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    params: dict[str, Any]
+    status: str = QUEUED
+    phase: str | None = None
+    done: int = 0
+    total: int = 0
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    args: Any = field(default=None, repr=False)  # params as parsed by JobManager.submit
+
+    def progress(self, phase: str, done: int, total: int) -> None:
+        self.phase, self.done, self.total = phase, done, total
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "progress": {"phase": self.phase, "done": self.done, "total": self.total},
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """Runs collect/enrich jobs on a long-lived repo, provider and scraper.
+
+    Job kinds and their params:
+
+    - ``collect-text``: one query spec (``query``, ``location``, ``radius``, ``types``, ``max``)
+    - ``collect-batch``: ``queries`` (list of specs), optional ``workers``
+    - ``collect-nearby``: ``location`` ("lat,lng"), ``radius``, ``types``, ``cell_radius``, ``max``
+    - ``enrich``: ``place_ids``
+
+    Collect jobs scrape emails for the new places unless ``enrich`` is false.
+    The request rate is enforced by the shared provider, per HTTP request, so one
+    rate-limited provider is one budget for every job in the process.
+    Cancellation is cooperative: it takes effect between API calls.
+    """
+
+    def __init__(
+        self,
+        repo: PlaceRepository,
+        provider: PlacesProvider,
+        scraper: EmailScraper,
+        *,
+        max_jobs: int = 2,
+        batch_workers: int = 8,
+        max_history: int = 1000,
+    ):
+        self.repo = repo
+        self.provider = provider
+        self.scraper = scraper
+        self.batch_workers = batch_workers
+        self.max_history = max_history
+        self._pool = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="job")
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+        # kind -> (parse params at submit time, run the job with the parsed args)
+        self._kinds: dict[str, tuple[Callable[[dict[str, Any]], Any], Callable[[Job], Any]]] = {
+            "collect-text": (TextQuerySpec.from_mapping, self._run_collect_text),
+            "collect-batch": (self._parse_collect_batch, self._run_collect_batch),
+            "collect-nearby": (_parse_collect_nearby, self._run_collect_nearby),
+            "enrich": (_parse_enrich, self._run_enrich),
+        }
+
+    @property
+    def kinds(self) -> list[str]:
+        return list(self._kinds)
+
+    def submit(self, kind: str, params: dict[str, Any] | None = None) -> Job:
+        """Validate `params` for `kind` and queue the job.
+
+        Raises ValueError/TypeError for an unknown kind or invalid params, so callers
+        can reject the request before anything is queued.
+        """
+        if kind not in self._kinds:
+            raise ValueError(f"unknown job kind {kind!r} (expected one of {self.kinds})")
+        params = {} if params is None else params
+        if not isinstance(params, dict):
+            raise TypeError(f"params must be an object, got {type(params).__name__}")
+        if not isinstance(params.get("enrich", True), bool):
+            raise TypeError(f"'enrich' must be true or false, got {params['enrich']!r}")
+        parse, _ = self._kinds[kind]
+        job = Job(id=uuid.uuid4().hex, kind=kind, params=params, args=parse(params))
+        with self._lock:
+            self._jobs[job.id] = job
+            self._trim_history()
+        self._pool.submit(self._execute, job)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> Job | None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.status not in FINISHED:
+                job.cancel_event.set()
+                if job.status == QUEUED:
+                    self._finish(job, CANCELLED)
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        for job in self.list_jobs():
+            if job.status not in FINISHED:
+                job.cancel_event.set()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _trim_history(self) -> None:
+        # called with the lock held; only finished jobs are evicted
+        excess = len(self._jobs) - self.max_history
+        for job_id in [j.id for j in self._jobs.values() if j.status in FINISHED][:excess]:
+            del self._jobs[job_id]
+
+    def _finish(self, job: Job, status: str) -> None:
+        # status transitions happen with self._lock held
+        job.status = status
+        job.finished_at = time.time()
+
+    def _execute(self, job: Job) -> None:
+        with self._lock:
+            if job.status != QUEUED:  # cancelled while queued
+                return
+            job.status = RUNNING
+            job.started_at = time.time()
+        _, run = self._kinds[job.kind]
+        status = DONE
+        try:
+            job.result = run(job)
+        except JobCancelled:
+            status = CANCELLED
+        except Exception as e:
+            logger.exception("job %s (%s) failed", job.id, job.kind)
+            job.error = str(e)
+            status = FAILED
+        with self._lock:
+            self._finish(job, status)
+
+    def _collect_places(self) -> CollectPlacesUseCase:
+        return CollectPlacesUseCase(self.repo, self.provider)
+
+    def _parse_collect_batch(self, params: dict[str, Any]) -> tuple[list[TextQuerySpec], int]:
+        queries = params.get("queries")
+        if not isinstance(queries, list) or not queries:
+            raise ValueError("'queries' must be a non-empty list of query specs")
+        specs = []
+        for i, q in enumerate(queries):
+            try:
+                specs.append(TextQuerySpec.from_mapping(q))
+            except (TypeError, ValueError) as e:
+                raise type(e)(f"queries[{i}]: {e}") from e
+        return specs, _positive_int(params, "workers", self.batch_workers)
+
+    def _run_collect_text(self, job: Job) -> dict[str, Any]:
+        spec: TextQuerySpec = job.args
+        places = self._collect_places().run_text(
+            query=spec.query,
+            location=spec.location,
+            radius_m=spec.radius_m,
+            types=spec.types,
+            max_results=spec.max_results,
+            cancel=job.cancel_event,
+            progress=job.progress,
+        )
+        return self._collected(job, places)
+
+    def _run_collect_batch(self, job: Job) -> dict[str, Any]:
+        specs, workers = job.args
+        uc = CollectBatchUseCase(self.repo, self.provider, max_workers=workers)
+        places, summaries = uc.run(specs, cancel=job.cancel_event, progress=job.progress)
+        result = self._collected(job, places)
+        result["queries"] = [vars(s) for s in summaries]
+        return result
+
+    def _run_collect_nearby(self, job: Job) -> dict[str, Any]:
+        places = self._collect_places().run_nearby_grid(
+            **job.args, cancel=job.cancel_event, progress=job.progress
+        )
+        return self._collected(job, places)
+
+    def _run_enrich(self, job: Job) -> dict[str, Any]:
+        places = []
+        for pid in job.args:
+            p = self.repo.get_by_id(pid)
+            if p:
+                places.append(p)
+        return {"emails": self._enrich(places, job.cancel_event, job.progress)}
+
+    def _collected(self, job: Job, places: list[Place]) -> dict[str, Any]:
+        result: dict[str, Any] = {"new": len(places)}
+        if job.params.get("enrich", True):
+            result["emails"] = self._enrich(places, job.cancel_event, job.progress)
+        return result
+
+    def _enrich(
+        self, places: list[Place], cancel: threading.Event, progress: ProgressFn
+    ) -> dict[str, str]:
+        enr = EnrichEmailsUseCase(self.repo, self.scraper)
+        found: dict[str, str] = {}
+        for n, p in enumerate(places, 1):
+            if cancel.is_set():
+                raise JobCancelled("cancelled during enrichment")
+            progress("enrich", n, len(places))
+            email = enr.run_for_place(p)
+            if email:
+                found[p.place_id] = email
+        return found
+
+
+def _positive_int(params: dict[str, Any], key: str, default: int) -> int:
+    value = params.get(key)
+    if value is None:
+        return default
+    try:
+        n = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid {key!r}: {value!r}") from None
+    if n <= 0:
+        raise ValueError(f"{key!r} must be > 0, got {n}")
+    return n
+
+
+def _parse_collect_nearby(params: dict[str, Any]) -> dict[str, Any]:
+    try:
+        lat, lng = (float(v) for v in str(params["location"]).split(","))
+    except KeyError:
+        raise ValueError("missing 'location'") from None
+    except ValueError:
+        raise ValueError(
+            f"invalid 'location' (expected \"lat,lng\"): {params['location']!r}"
+        ) from None
+    if params.get("radius") is None:
+        raise ValueError("missing 'radius'")
+    types = split_types(params.get("types"))
+    if not types:
+        raise ValueError("missing 'types'")
+    return {
+        "center_lat": lat,
+        "center_lng": lng,
+        "radius_m": _positive_int(params, "radius", 0),
+        "types": types,
+        "cell_radius_m": _positive_int(params, "cell_radius", 600),
+        "overall_max": _positive_int(params, "max", 1000),
+    }
+
+
+def _parse_enrich(params: dict[str, Any]) -> list[str]:
+    place_ids = params.get("place_ids")
+    if not isinstance(place_ids, list) or not all(isinstance(p, str) for p in place_ids):
+        raise ValueError("'place_ids' must be a list of strings")
+    return place_ids
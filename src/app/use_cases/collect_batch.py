@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.entities import Place
+from src.core.errors import JobCancelled
+from src.core.ports import PlaceRepository, PlacesProvider, ProgressFn
+from src.utils.id_index import PlaceIdIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _optional_positive_int(row: Mapping[str, Any], key: str) -> int | None:
+    value = row.get(key)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    try:
+        n = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid {key!r}: {value!r}") from None
+    if n <= 0:
+        raise ValueError(f"{key!r} must be > 0, got {n}")
+    return n
+
+
+def split_types(value: str | list[str] | None) -> list[str] | None:
+    if isinstance(value, str):
+        value = value.split(",")
+    return [t.strip() for t in value or [] if t and t.strip()] or None
+
+
+@dataclass(frozen=True)
+class TextQuerySpec:
+    query: str
+    location: str | None = None
+    radius_m: int | None = None
+    types: list[str] | None = None
+    max_results: int = 120
+
+    @classmethod
+    def from_mapping(cls, row: Mapping[str, Any], *, default_max: int = 120) -> TextQuerySpec:
+        """Build a spec from a JSON object or CSV row.
+
+        Keys: query (required), location ("lat,lng"), radius, types (list or
+        comma-separated string), max. Empty values are treated as missing;
+        radius and max must be positive.
+        """
+        if not isinstance(row, Mapping):
+            raise TypeError(f"query spec must be an object, got {type(row).__name__}")
+        query = str(row.get("query") or "").strip()
+        if not query:
+            raise ValueError("missing 'query'")
+        max_results = _optional_positive_int(row, "max")
+        return cls(
+            query=query,
+            location=str(row.get("location") or "").strip() or None,
+            radius_m=_optional_positive_int(row, "radius"),
+            types=split_types(row.get("types")),
+            max_results=default_max if max_results is None else max_results,
+        )
+
+
+@dataclass
+class QuerySummary:
+    query: str
+    hits: int = 0
+    new: int = 0
+    duplicates: int = 0  # already returned earlier in the batch
+    known: int = 0  # already stored in the repository
+    failed: int = 0  # details calls that raised
+    error: str | None = None
+
+
+class CollectBatchUseCase:
+    """Runs many text searches concurrently and fetches details once per new place_id.
+
+    `max_workers` bounds concurrency only; the request rate is enforced per HTTP
+    request by the provider (see `PlacesV1Client(limiter=...)`).
+
+    `cancel` is passed to every provider call, so setting it wakes calls waiting
+    for a rate slot and makes queued ones raise `JobCancelled` at once; calls
+    already in flight finish, and `run` then raises `JobCancelled`. Any other
+    exception escaping `run` (including KeyboardInterrupt) sets `cancel` too.
+    """
+
+    def __init__(
+        self,
+        repo: PlaceRepository,
+        provider: PlacesProvider,
+        *,
+        max_workers: int = 8,
+    ):
+        self.repo = repo
+        self.provider = provider
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        specs: list[TextQuerySpec],
+        *,
+        cancel: threading.Event | None = None,
+        progress: ProgressFn | None = None,
+    ) -> tuple[list[Place], list[QuerySummary]]:
+        cancel = cancel or threading.Event()
+        progress = progress or (lambda phase, done, total: None)
+        summaries = [QuerySummary(query=s.query) for s in specs]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            try:
+                results = self._search_all(pool, cancel, progress, specs, summaries)
+                if cancel.is_set():
+                    raise JobCancelled("batch cancelled during search")
+                pending = self._dedupe(results, summaries)
+                out = self._details_and_store(pool, cancel, progress, pending, summaries)
+                if cancel.is_set():
+                    raise JobCancelled("batch cancelled during details")
+            except BaseException:
+                # e.g. KeyboardInterrupt or a failed upsert: drop queued calls and
+                # stop those waiting for a rate slot before the pool joins them
+                cancel.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+        return out, summaries
+
+    def _search_all(
+        self,
+        pool: ThreadPoolExecutor,
+        cancel: threading.Event,
+        progress: ProgressFn,
+        specs: list[TextQuerySpec],
+        summaries: list[QuerySummary],
+    ) -> list[list[Place] | None]:
+        def search(spec: TextQuerySpec) -> list[Place]:
+            if cancel.is_set():
+                raise JobCancelled(spec.query)
+            return self.provider.text_search(
+                query=spec.query,
+                location=spec.location,
+                radius_m=spec.radius_m,
+                types=spec.types,
+                max_results=spec.max_results,
+                cancel=cancel,
+            )
+
+        results: list[list[Place] | None] = [None] * len(specs)
+        futures = {pool.submit(search, s): i for i, s in enumerate(specs)}
+        for n, fut in enumerate(as_completed(futures), 1):
+            progress("search", n, len(futures))
+            i = futures[fut]
+            try:
+                results[i] = fut.result()
+            except JobCancelled:
+                continue
+            except Exception as e:
+                logger.warning("text search failed for %r: %s", specs[i].query, e)
+                summaries[i].error = str(e)
+        return results
+
+    def _dedupe(
+        self, results: list[list[Place] | None], summaries: list[QuerySummary]
+    ) -> list[tuple[str, int]]:
+        # Walk results in input order so each place_id is credited to the first
+        # query that returned it, regardless of which search finished first.
+        seen = PlaceIdIndex()
+        pending: list[tuple[str, int]] = []
+        for i, hits in enumerate(results):
+            if hits is None:
+                continue
+            summary = summaries[i]
+            summary.hits = len(hits)
+            for h in hits:
+                if not h.place_id:
+                    continue
+                if h.place_id in seen:
+                    summary.duplicates += 1
+                    continue
+                seen.add(h.place_id)
+                if self.repo.is_known(h.place_id):
+                    summary.known += 1
+                    continue
+                pending.append((h.place_id, i))
+        return pending
+
+    def _details_and_store(
+        self,
+        pool: ThreadPoolExecutor,
+        cancel: threading.Event,
+        progress: ProgressFn,
+        pending: list[tuple[str, int]],
+        summaries: list[QuerySummary],
+    ) -> list[Place]:
+        def details(place_id: str) -> Place:
+            if cancel.is_set():
+                raise JobCancelled(place_id)
+            return self.provider.place_details(place_id, cancel=cancel)
+
+        out: list[Place] = []
+        futures = {pool.submit(details, pid): (pid, i) for pid, i in pending}
+        for n, fut in enumerate(as_completed(futures), 1):
+            progress("details", n, len(futures))
+            pid, i = futures[fut]
+            try:
+                d = fut.result()
+            except JobCancelled:
+                continue
+            except Exception as e:
+                logger.warning("place details failed for %s: %s", pid, e)
+                summaries[i].failed += 1
+                continue
+            # upserts stay on the calling thread; only the HTTP calls are concurrent
+            self.repo.upsert(d)
+            summaries[i].new += 1
+            out.append(d)
+        return out
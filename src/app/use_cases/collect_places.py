@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Optional
 
 from src.core.entities import Place
-from src.core.ports import PlaceRepository, PlacesProvider
+from src.core.errors import JobCancelled
+from src.core.ports import PlaceRepository, PlacesProvider, ProgressFn
+
+
+def _check(cancel: threading.Event | None) -> None:
+    if cancel is not None and cancel.is_set():
+        raise JobCancelled("cancelled")
 
 
 class CollectPlacesUseCase:
+    # Rate limiting is the provider's job (per HTTP request); `cancel` is passed
+    # through to it and also checked between details calls.
     def __init__(self, repo: PlaceRepository, provider: PlacesProvider):
         self.repo = repo
         self.provider = provider
@@ -18,13 +27,21 @@ class CollectPlacesUseCase:
         query: str,
         location: str | None,
         radius_m: int | None,
-        types: str | None,
+        types: list[str] | None,
         max_results: int,
+        cancel: threading.Event | None = None,
+        progress: ProgressFn | None = None,
     ) -> list[Place]:
+        _check(cancel)
         hits = self.provider.text_search(
-            query=query, location=location, radius_m=radius_m, type_=types, max_results=max_results
+            query=query,
+            location=location,
+            radius_m=radius_m,
+            types=types,
+            max_results=max_results,
+            cancel=cancel,
         )
-        return self._details_and_store(hits)
+        return self._details_and_store(hits, cancel=cancel, progress=progress)
 
     def run_nearby_grid(
         self,
@@ -35,7 +52,10 @@ class CollectPlacesUseCase:
         types: list[str],
         cell_radius_m: int,
         overall_max: int,
+        cancel: threading.Event | None = None,
+        progress: ProgressFn | None = None,
     ) -> list[Place]:
+        _check(cancel)
         hits = self.provider.nearby_grid_search(
             center_lat=center_lat,
             center_lng=center_lng,
@@ -43,17 +63,27 @@ class CollectPlacesUseCase:
             types=types,
             cell_radius_m=cell_radius_m,
             overall_max=overall_max,
+            cancel=cancel,
         )
-        return self._details_and_store(hits)
+        return self._details_and_store(hits, cancel=cancel, progress=progress)
 
-    def _details_and_store(self, hits: list[Place]) -> list[Place]:
+    def _details_and_store(
+        self,
+        hits: list[Place],
+        *,
+        cancel: threading.Event | None = None,
+        progress: ProgressFn | None = None,
+    ) -> list[Place]:
         out: list[Place] = []
-        for h in hits:
+        for n, h in enumerate(hits, 1):
+            if progress:
+                progress("details", n, len(hits))
             if not h.place_id:
                 continue
-            if self.repo.get_by_id(h.place_id):
+            if self.repo.is_known(h.place_id):
                 continue  # ya existe
-            d = self.provider.place_details(h.place_id)
+            _check(cancel)
+            d = self.provider.place_details(h.place_id, cancel=cancel)
             self.repo.upsert(d)
             out.append(d)
         return out
@@ -5,3 +5,6 @@ class ProviderError(DomainError): ...
 
 
 class PersistenceError(DomainError): ...
+
+
+class JobCancelled(DomainError): ...
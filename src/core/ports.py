@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Protocol
 
 from .entities import Place
 
+# Progress callback for long-running use cases: (phase, done, total)
+ProgressFn = Callable[[str, int, int], None]
+
 
 class PlaceRepository(ABC):
     @abstractmethod
@@ -12,18 +17,23 @@ class PlaceRepository(ABC):
     @abstractmethod
     def get_by_id(self, place_id: str) -> Place | None: ...
     @abstractmethod
+    def is_known(self, place_id: str) -> bool: ...
+    @abstractmethod
     def update_email(self, place_id: str, email: str) -> None: ...
 
 
 class PlacesProvider(Protocol):
+    # `cancel` aborts pending work with JobCancelled; implementations that rate-limit
+    # should do so per HTTP request
     def text_search(
         self,
         *,
         query: str,
         location: str | None,
         radius_m: int | None,
-        types_: list[str] | None,
+        types: list[str] | None,
         max_results: int,
+        cancel: threading.Event | None = None,
     ) -> list[Place]: ...
 
     def nearby_grid_search(
@@ -35,9 +45,10 @@ class PlacesProvider(Protocol):
         types: list[str],
         cell_radius_m: int,
         overall_max: int,
+        cancel: threading.Event | None = None,
     ) -> list[Place]: ...
 
-    def place_details(self, place_id: str) -> Place: ...
+    def place_details(self, place_id: str, *, cancel: threading.Event | None = None) -> Place: ...
 
 
 class EmailScraper(Protocol):
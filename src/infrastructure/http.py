@@ -0,0 +1,17 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def make_session(pool_maxsize: int = 10) -> requests.Session:
+    """Session whose per-host connection pool fits `pool_maxsize` concurrent threads.
+
+    Sessions are shared across worker threads; that is safe for the stateless
+    GET/POST calls made here because urllib3's pools are thread-safe, but nothing
+    should rely on session cookies. With fewer pooled connections than threads,
+    urllib3 discards the extras after each request and keep-alive is lost.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=max(1, pool_maxsize))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
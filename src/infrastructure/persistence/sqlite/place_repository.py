@@ -1,10 +1,17 @@
+import logging
+import threading
+import time
+
 from sqlalchemy import text
 
 from src.core.entities import Place
 from src.core.ports import PlaceRepository
+from src.utils.id_index import PlaceIdIndex
 
 from .db import make_engine
 
+logger = logging.getLogger(__name__)
+
 UPSERT_SQL = """
 INSERT INTO places (place_id, name, address, website, phone, lat, lng, email, updated_at, email_scraped_at, types)
 VALUES (:place_id, :name, :address, :website, :phone, :lat, :lng, :email, datetime('now'), :email_scraped_at, :types)
@@ -31,6 +38,10 @@ ON CONFLICT(place_id) DO UPDATE SET
 
 SELECT_ONE_SQL = "SELECT place_id,name,address,website,phone,lat,lng,email,types FROM places WHERE place_id=:place_id;"
 
+COUNT_SQL = "SELECT COUNT(*) FROM places;"
+
+SELECT_IDS_SQL = "SELECT place_id FROM places;"
+
 SELECT_BY_TYPE_SQL = """
 SELECT place_id,name,address,website,phone,lat,lng,email
 FROM places
@@ -50,6 +61,32 @@ WHERE place_id = :place_id AND :email IS NOT NULL AND lower(:email) NOT LIKE '%e
 class SQLitePlaceRepository(PlaceRepository):
     def __init__(self, path: str = "places.db"):
         self.engine = make_engine(path)
+        self._known: PlaceIdIndex | None = None
+        self._known_lock = threading.Lock()
+
+    @property
+    def known_ids(self) -> PlaceIdIndex:
+        """In-memory index of stored place_ids, loaded on first use and kept in sync by upsert."""
+        if self._known is None:
+            with self._known_lock:
+                if self._known is None:
+                    self._known = self._load_known_ids()
+        return self._known
+
+    def _load_known_ids(self) -> PlaceIdIndex:
+        t0 = time.monotonic()
+        with self.engine.connect() as conn:
+            count = conn.execute(text(COUNT_SQL)).scalar_one()
+            index = PlaceIdIndex(capacity=count)
+            for pid in conn.execute(text(SELECT_IDS_SQL)).scalars():
+                index.add(pid)
+        logger.info(
+            "loaded %d known place ids in %.2fs (%.1f MiB)",
+            len(index),
+            time.monotonic() - t0,
+            index.nbytes / 2**20,
+        )
+        return index
 
     @staticmethod
     def _types_to_set(s: str | None) -> set[str]:
@@ -91,6 +128,10 @@ class SQLitePlaceRepository(PlaceRepository):
                 "types": merged,
             }
             conn.execute(text(UPSERT_SQL), payload)
+        # after commit; if the index isn't loaded yet the lazy load will read this row
+        with self._known_lock:
+            if self._known is not None:
+                self._known.add(place.place_id)
 
     def get_by_id(self, place_id: str):
         with self.engine.begin() as conn:
@@ -100,6 +141,10 @@ class SQLitePlaceRepository(PlaceRepository):
             d = dict(row._mapping)
             return Place(**d)
 
+    def is_known(self, place_id: str) -> bool:
+        known = self._known if self._known is not None else self.known_ids
+        return place_id in known
+
     def update_email(self, place_id: str, email: str) -> None:
         with self.engine.begin() as conn:
             conn.execute(text(UPDATE_EMAIL_SQL), {"place_id": place_id, "email": email})
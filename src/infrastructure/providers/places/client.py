@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import math
 import os
+import threading
 import time
 from typing import Any
 
@@ -10,7 +11,11 @@ import backoff
 import requests
 
 from src.core.entities import Place
+from src.core.errors import JobCancelled
 from src.core.ports import PlacesProvider
+from src.infrastructure.http import make_session
+from src.utils.id_index import PlaceIdIndex
+from src.utils.rate_limit import RateLimiter
 
 BASE_V1 = "https://places.googleapis.com/v1"
 API_KEY_ENV = "GOOGLE_MAPS_API_KEY"
@@ -44,8 +49,50 @@ def _deg_lng(m, lat):
 
 
 class PlacesV1Client(PlacesProvider):
+    """Places API (New) client.
+
+    With a `limiter`, every HTTP request (each page, each grid cell, each backoff
+    retry) takes one slot, so its rate is the real request budget for everything
+    sharing this client. `cancel` aborts waits for slots and page delays with
+    `JobCancelled`.
+    """
+
     logger = logging.getLogger(__name__)
-    
+
+    # pause before requesting the next page token / the next grid cell
+    PAGE_DELAY_S = 1.6
+    NEARBY_PAGE_DELAY_S = 1.5
+    CELL_DELAY_S = 0.2
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        *,
+        pool_maxsize: int = 10,
+        limiter: RateLimiter | None = None,
+    ):
+        # one Session per client so keep-alive connections survive across calls;
+        # pool_maxsize should cover every thread that calls this client at once
+        self.session = session or make_session(pool_maxsize)
+        self.limiter = limiter
+
+    def _request(
+        self, method: str, url: str, cancel: threading.Event | None, **kwargs: Any
+    ) -> requests.Response:
+        if self.limiter is not None:
+            if not self.limiter.acquire(cancel):
+                raise JobCancelled(f"cancelled before {method} {url}")
+        elif cancel is not None and cancel.is_set():
+            raise JobCancelled(f"cancelled before {method} {url}")
+        return self.session.request(method, url, timeout=30, **kwargs)
+
+    @staticmethod
+    def _pause(seconds: float, cancel: threading.Event | None) -> None:
+        if cancel is None:
+            time.sleep(seconds)
+        elif cancel.wait(seconds):
+            raise JobCancelled("cancelled between pages")
+
     @backoff.on_exception(backoff.expo, (requests.RequestException,), max_time=60)
     def text_search(
         self,
@@ -55,7 +102,10 @@ class PlacesV1Client(PlacesProvider):
         radius_m: int | None,
         types: list[str] | None,
         max_results: int = 120,
+        cancel: threading.Event | None = None,
     ) -> list[Place]:
+        if max_results <= 0:
+            return []
         url = f"{BASE_V1}/places:searchText"
         field_mask = "places.name,places.displayName,places.formattedAddress,places.types"
         body: dict[str, Any] = {"textQuery": query, "pageSize": 20}
@@ -73,7 +123,7 @@ class PlacesV1Client(PlacesProvider):
             payload = dict(body)
             if token:
                 payload["pageToken"] = token
-            r = requests.post(url, headers=_headers(field_mask), json=payload, timeout=30)
+            r = self._request("POST", url, cancel, headers=_headers(field_mask), json=payload)
             data = r.json()
             if r.status_code >= 400 or "places" not in data:
                 raise RuntimeError(f"Text Search v1 error: {data}")
@@ -91,15 +141,15 @@ class PlacesV1Client(PlacesProvider):
             token = data.get("nextPageToken")
             if not token:
                 return out
-            time.sleep(1.6)
+            self._pause(self.PAGE_DELAY_S, cancel)
 
     @backoff.on_exception(backoff.expo, (requests.RequestException,), max_time=60)
-    def place_details(self, place_id: str) -> Place:
+    def place_details(self, place_id: str, *, cancel: threading.Event | None = None) -> Place:
         url = f"{BASE_V1}/places/{place_id}"
         field_mask = (
             "name,displayName,formattedAddress,websiteUri,internationalPhoneNumber,location,types"
         )
-        r = requests.get(url, headers=_headers(field_mask), timeout=30)
+        r = self._request("GET", url, cancel, headers=_headers(field_mask))
         d = r.json()
         if r.status_code >= 400:
             raise RuntimeError(f"Place Details v1 error: {d}")
@@ -125,6 +175,7 @@ class PlacesV1Client(PlacesProvider):
         types: list[str],
         excluded_types: list[str] | None = None,
         rank_preference: str = "DISTANCE",
+        cancel: threading.Event | None = None,
     ) -> list[Place]:
         url = f"{BASE_V1}/places:searchNearby"
         field_mask = (
@@ -148,7 +199,7 @@ class PlacesV1Client(PlacesProvider):
             payload = dict(body)
             if token:
                 payload["pageToken"] = token
-            r = requests.post(url, headers=_headers(field_mask), json=payload, timeout=30)
+            r = self._request("POST", url, cancel, headers=_headers(field_mask), json=payload)
             data = r.json()
             if r.status_code >= 400:
                 raise RuntimeError(f"Nearby v1 error: {data}")
@@ -171,7 +222,7 @@ class PlacesV1Client(PlacesProvider):
             token = data.get("nextPageToken")
             if not token:
                 break
-            time.sleep(1.5)
+            self._pause(self.NEARBY_PAGE_DELAY_S, cancel)
         return out
 
     def _grid_centers(
@@ -198,6 +249,7 @@ class PlacesV1Client(PlacesProvider):
         overall_max: int = 2000,
         excluded_types: list[str] | None = None,
         rank_preference: str = "DISTANCE",
+        cancel: threading.Event | None = None,
     ) -> list[Place]:
         centers = self._grid_centers(
             center_lat=center_lat,
@@ -205,7 +257,7 @@ class PlacesV1Client(PlacesProvider):
             radius_m=radius_m,
             cell_radius_m=cell_radius_m,
         )
-        seen, out = set(), []
+        seen, out = PlaceIdIndex(), []
         for lat, lng in centers:
             batch = self._nearby_circle(
                 center_lat=lat,
@@ -214,8 +266,9 @@ class PlacesV1Client(PlacesProvider):
                 types=types,
                 excluded_types=excluded_types,
                 rank_preference=rank_preference,
+                cancel=cancel,
             )
-            
+
             for p in batch:
                 self.logger.info(f"[BATCH] {p.name} -> {p.website}")
                 if p.place_id and p.place_id not in seen:
@@ -223,5 +276,5 @@ class PlacesV1Client(PlacesProvider):
                     out.append(p)
                     if len(out) >= overall_max:
                         return out
-            time.sleep(0.2)  # cortesía
+            self._pause(self.CELL_DELAY_S, cancel)  # cortesía
         return out
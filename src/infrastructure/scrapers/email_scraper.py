@@ -6,15 +6,20 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from src.infrastructure.http import make_session
+
 
 class MailtoScraper:
     DEFAULT_HEADERS = {
         "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome Safari"
     }
 
+    def __init__(self, session: requests.Session | None = None, *, pool_maxsize: int = 10):
+        self.session = session or make_session(pool_maxsize)
+
     def _fetch(self, url: str, timeout: int = 15) -> str | None:
         try:
-            r = requests.get(
+            r = self.session.get(
                 url, headers=self.DEFAULT_HEADERS, timeout=timeout, allow_redirects=True
             )
             if r.status_code >= 400:
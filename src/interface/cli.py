@@ -2,23 +2,63 @@ import argparse
 import logging
 import time
 
+from src.app.jobs import JobManager
+from src.app.use_cases.collect_batch import CollectBatchUseCase
 from src.app.use_cases.collect_places import CollectPlacesUseCase
 from src.app.use_cases.enrich_emails import EnrichEmailsUseCase
 from src.infrastructure.persistence.sqlite.place_repository import SQLitePlaceRepository
 from src.infrastructure.providers.places.client import PlacesV1Client
 from src.infrastructure.scrapers.email_scraper import MailtoScraper
+from src.interface.query_file import load_query_specs
+from src.interface.server import make_server
 from src.utils.config import load_env
 from src.utils.logging import setup_logging
+from src.utils.rate_limit import RateLimiter
 
 
-def build_container(dbpath: str):
+def build_container(
+    dbpath: str,
+    *,
+    api_threads: int = 1,
+    scraper_threads: int = 1,
+    rate_per_s: float | None = None,
+):
     load_env()
     repo = SQLitePlaceRepository(dbpath)
-    provider = PlacesV1Client()
-    scraper = MailtoScraper()
+    # the limiter lives in the client so every HTTP request (pages, cells, retries) pays
+    limiter = RateLimiter(rate_per_s) if rate_per_s else None
+    provider = PlacesV1Client(pool_maxsize=max(10, api_threads), limiter=limiter)
+    scraper = MailtoScraper(pool_maxsize=max(10, scraper_threads))
     return repo, provider, scraper
 
 
+def _enrich_on_the_fly(repo, scraper, places):
+    enr = EnrichEmailsUseCase(repo, scraper)
+    for p in places:
+        if p.website:
+            email = enr.run_for_place(p)
+            if email:
+                print(f"[EMAIL] {p.name} -> {email}")
+            time.sleep(0.05)
+
+
+def _print_batch_summary(summaries):
+    for s in summaries:
+        if s.error:
+            print(f"[QUERY] {s.query}: ERROR {s.error}")
+            continue
+        print(
+            f"[QUERY] {s.query}: hits={s.hits} new={s.new} dup={s.duplicates} "
+            f"known={s.known} failed={s.failed}"
+        )
+    errors = sum(1 for s in summaries if s.error)
+    print(
+        f"[BATCH] queries={len(summaries)} errors={errors} "
+        f"new={sum(s.new for s in summaries)} dup={sum(s.duplicates for s in summaries)} "
+        f"known={sum(s.known for s in summaries)}"
+    )
+
+
 def main():
     setup_logging()
     ap = argparse.ArgumentParser(description="Places collector (v1) + email scraper")
@@ -28,7 +68,7 @@ def main():
     p1.add_argument("--query", required=True)
     p1.add_argument("--location", default=None)
     p1.add_argument("--radius", type=int, default=None)
-    p1.add_argument("--type", default=None)
+    p1.add_argument("--types", default=None)
     p1.add_argument("--max", type=int, default=120)
     p1.add_argument("--dbpath", default="places.db")
 
@@ -40,14 +80,42 @@ def main():
     p2.add_argument("--max", type=int, default=1000)
     p2.add_argument("--dbpath", default="places.db")
 
+    p4 = sub.add_parser("collect-batch")
+    p4.add_argument("--file", required=True, help="JSONL or CSV of query specs")
+    p4.add_argument("--workers", type=int, default=8)
+    p4.add_argument("--rate", type=float, default=5.0, help="max Places API HTTP requests/second")
+    p4.add_argument("--max", type=int, default=120, help="default max results per query")
+    p4.add_argument("--dbpath", default="places.db")
+
     p3 = sub.add_parser("enrich-missing")
     p3.add_argument("--place-id", required=False)
     p3.add_argument("--dbpath", default="places.db")
 
+    p5 = sub.add_parser("serve", help="resident worker with a local HTTP job API")
+    p5.add_argument("--host", default="127.0.0.1")
+    p5.add_argument("--port", type=int, default=8765)
+    p5.add_argument("--socket", default=None, help="listen on this unix socket instead of TCP")
+    p5.add_argument("--jobs", type=int, default=2, help="jobs running at the same time")
+    p5.add_argument("--workers", type=int, default=8, help="default workers per collect-batch job")
+    p5.add_argument(
+        "--rate", type=float, default=5.0, help="max Places API HTTP requests/second, all jobs"
+    )
+    p5.add_argument("--dbpath", default="places.db")
+
     args = ap.parse_args()
 
-    repo, provider, scraper = build_container(args.dbpath)
-    cli_types = [t.strip() for t in (args.types or "").split(",") if t.strip()]
+    # size HTTP pools for the threads that share the provider/scraper sessions
+    if args.cmd == "serve":
+        api_threads, scraper_threads = args.jobs * args.workers, args.jobs
+    else:
+        api_threads, scraper_threads = getattr(args, "workers", 1), 1
+    repo, provider, scraper = build_container(
+        args.dbpath,
+        api_threads=api_threads,
+        scraper_threads=scraper_threads,
+        rate_per_s=getattr(args, "rate", None),
+    )
+    cli_types = [t.strip() for t in (getattr(args, "types", None) or "").split(",") if t.strip()]
 
     try:
         if args.cmd == "collect-text":
@@ -56,17 +124,11 @@ def main():
                 query=args.query,
                 location=args.location,
                 radius_m=args.radius,
-                types_=cli_types,
+                types=cli_types,
                 max_results=args.max,
             )
             # Scraping “al vuelo”
-            enr = EnrichEmailsUseCase(repo, scraper)
-            for p in places:
-                if p.website:
-                    email = enr.run_for_place(p)
-                    if email:
-                        print(f"[EMAIL] {p.name} -> {email}")
-                    time.sleep(0.05)
+            _enrich_on_the_fly(repo, scraper, places)
 
         elif args.cmd == "collect-nearby":
             lat, lng = map(float, args.location.split(","))
@@ -79,13 +141,16 @@ def main():
                 cell_radius_m=args.cell_radius,
                 overall_max=args.max,
             )
-            enr = EnrichEmailsUseCase(repo, scraper)
-            for p in places:
-                if p.website:
-                    email = enr.run_for_place(p)
-                    if email:
-                        print(f"[EMAIL] {p.name} -> {email}")
-                    time.sleep(0.05)
+            _enrich_on_the_fly(repo, scraper, places)
+
+        elif args.cmd == "collect-batch":
+            specs = load_query_specs(args.file, default_max=args.max)
+            uc = CollectBatchUseCase(repo, provider, max_workers=args.workers)
+            places, summaries = uc.run(specs)
+            _enrich_on_the_fly(repo, scraper, places)
+            _print_batch_summary(summaries)
+            known = repo.known_ids
+            print(f"[INDEX] known_ids={len(known)} memory={known.nbytes / 2**20:.1f}MiB")
 
         elif args.cmd == "enrich-missing":
             # enriquecimiento puntual por place_id si lo pasas (rápido)
@@ -97,6 +162,30 @@ def main():
             else:
                 print("Pass --place-id (or implement a repo method to iterate missing emails).")
 
+        elif args.cmd == "serve":
+            manager = JobManager(
+                repo,
+                provider,
+                scraper,
+                max_jobs=args.jobs,
+                batch_workers=args.workers,
+            )
+            server = make_server(manager, host=args.host, port=args.port, socket_path=args.socket)
+            # load the dedupe index now rather than on the first job
+            known = repo.known_ids
+            logging.getLogger(__name__).info(
+                "serving jobs on %s (%d known places)",
+                args.socket or f"http://{args.host}:{args.port}",
+                len(known),
+            )
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+                manager.shutdown()
+
     finally:
         repo.close()
 
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from src.app.use_cases.collect_batch import TextQuerySpec
+
+
+def _rows(path: Path) -> Iterator[tuple[int, Any]]:
+    """Yield (line number, row) pairs; CSV rows report the line they end on.
+
+    A leading UTF-8 BOM (as written by Excel) is skipped.
+    """
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for n, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{n}: invalid JSON ({e})") from e
+            yield n, row
+
+
+def load_query_specs(path: str, *, default_max: int = 120) -> list[TextQuerySpec]:
+    """Read query specs from a `.csv` file (with header) or JSONL (any other suffix)."""
+    specs: list[TextQuerySpec] = []
+    for n, row in _rows(Path(path)):
+        try:
+            specs.append(TextQuerySpec.from_mapping(row, default_max=default_max))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"{path}:{n}: {e}") from e
+    return specs
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import socketserver
+import stat
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from src.app.jobs import JobManager
+
+logger = logging.getLogger(__name__)
+
+# Routes:
+#   GET    /health               -> {"status": "ok", "kinds": [...],
+#                                    "known_ids": {"count": n, "bytes": n}}
+#   GET    /jobs                 -> [job, ...]
+#   POST   /jobs                 -> {"kind": ..., "params": {...}}  => 202 job
+#   GET    /jobs/<id>            -> job (status, progress, result)
+#   DELETE /jobs/<id>            -> cancel, returns job
+#   POST   /jobs/<id>/cancel     -> same as DELETE
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    manager: JobManager  # set on the per-server subclass by make_server()
+
+    def address_string(self) -> str:
+        # unix sockets have no (host, port) client address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status: HTTPStatus, body: Any) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _parts(self) -> list[str]:
+        return [p for p in self.path.split("?", 1)[0].split("/") if p]
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _health(self) -> dict[str, Any]:
+        body: dict[str, Any] = {"status": "ok", "kinds": self.manager.kinds}
+        known = getattr(self.manager.repo, "known_ids", None)  # not part of PlaceRepository
+        if known is not None:
+            body["known_ids"] = {"count": len(known), "bytes": known.nbytes}
+        return body
+
+    def _job_or_404(self, job_id: str) -> None:
+        job = self.manager.get(job_id)
+        if job is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"no job {job_id}"})
+        else:
+            self._send(HTTPStatus.OK, job.to_dict())
+
+    def do_GET(self) -> None:
+        parts = self._parts()
+        if parts == ["health"]:
+            self._send(HTTPStatus.OK, self._health())
+        elif parts == ["jobs"]:
+            self._send(HTTPStatus.OK, [j.to_dict() for j in self.manager.list_jobs()])
+        elif len(parts) == 2 and parts[0] == "jobs":
+            self._job_or_404(parts[1])
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        parts = self._parts()
+        if parts == ["jobs"]:
+            try:
+                body = self._read_json()
+                if not isinstance(body, dict):
+                    raise TypeError("request body must be a JSON object")
+                job = self.manager.submit(body.get("kind", ""), body.get("params"))
+            except (ValueError, TypeError) as e:
+                self._send(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+                return
+            self._send(HTTPStatus.ACCEPTED, job.to_dict())
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "cancel":
+            self.manager.cancel(parts[1])
+            self._job_or_404(parts[1])
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    def do_DELETE(self) -> None:
+        parts = self._parts()
+        if len(parts) == 2 and parts[0] == "jobs":
+            self.manager.cancel(parts[1])
+            self._job_or_404(parts[1])
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+
+class UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        # replace a stale socket from a previous run, but never anything else
+        try:
+            mode = os.stat(self.server_address).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"{self.server_address} exists and is not a socket")
+            os.unlink(self.server_address)
+        super().server_bind()
+        self._bound = True
+        # BaseHTTPRequestHandler reads these for the Server/Host headers
+        self.server_name = "localhost"
+        self.server_port = 0
+
+    def server_close(self) -> None:
+        super().server_close()
+        # also called by __init__ when bind fails; only remove a socket we created
+        if getattr(self, "_bound", False):
+            self._bound = False
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.server_address)
+
+
+def make_server(
+    manager: JobManager,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | None = None,
+) -> socketserver.BaseServer:
+    """Bind (but don't start) a server for `manager` on TCP or, if given, a unix socket.
+
+    Pass ``port=0`` to bind an ephemeral port; read it back from ``server.server_address``.
+    """
+    handler = type("BoundJobRequestHandler", (JobRequestHandler,), {"manager": manager})
+    if socket_path:
+        return UnixHTTPServer(socket_path, handler)
+    return ThreadingHTTPServer((host, port), handler)
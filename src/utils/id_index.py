@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+
+_MASK64 = (1 << 64) - 1
+_MIN_SLOTS = 1024
+
+
+def _fingerprint(place_id: str) -> int:
+    # str hashes are 64-bit SipHash and cached on the object; they are salted per
+    # process, which is fine because the index is never persisted. 0 marks an empty slot.
+    return (hash(place_id) & _MASK64) or 1
+
+
+class PlaceIdIndex:
+    """Compact set of place_ids stored as 64-bit fingerprints in a flat `array('Q')`.
+
+    Open addressing with linear probing, kept at most half full: 16-32 bytes per id
+    instead of ~100 for a `set[str]`, and a lookup is one hash plus one or two probes.
+    Misses are exact; a hit can be a fingerprint collision with probability about
+    len(index) / 2**64, negligible for any realistic number of places.
+
+    `add` is not thread-safe; callers that share an index must serialise writes.
+    """
+
+    def __init__(self, place_ids: Iterable[str] = (), *, capacity: int = 0):
+        slots = _MIN_SLOTS
+        while slots < capacity * 2:
+            slots *= 2
+        self._table = array("Q", bytes(8 * slots))
+        self._count = 0
+        for pid in place_ids:
+            self.add(pid)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, place_id: object) -> bool:
+        # _fingerprint inlined: this is the hot path of every dedupe check
+        fp = (hash(place_id) & _MASK64) or 1
+        table = self._table
+        mask = len(table) - 1
+        i = fp & mask
+        while True:
+            slot = table[i]
+            if slot == fp:
+                return True
+            if not slot:
+                return False
+            i = (i + 1) & mask
+
+    def add(self, place_id: str) -> bool:
+        """Insert `place_id`; return False if it was already present."""
+        if (self._count + 1) * 2 > len(self._table):
+            self._grow()
+        if self._insert(self._table, _fingerprint(place_id)):
+            self._count += 1
+            return True
+        return False
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._table) * self._table.itemsize
+
+    @staticmethod
+    def _insert(table: array, fp: int) -> bool:
+        mask = len(table) - 1
+        i = fp & mask
+        while True:
+            slot = table[i]
+            if slot == fp:
+                return False
+            if not slot:
+                table[i] = fp
+                return True
+            i = (i + 1) & mask
+
+    def _grow(self) -> None:
+        table = array("Q", bytes(2 * self.nbytes))
+        for fp in self._table:
+            if fp:
+                self._insert(table, fp)
+        self._table = table
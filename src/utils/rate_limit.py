@@ -0,0 +1,33 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls to at most `rate_per_s` per second.
+
+    A slot is only taken when a caller is allowed through, so callers that give up
+    (via `cancel`) never hold back anyone else.
+    """
+
+    def __init__(self, rate_per_s: float):
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be > 0")
+        self.interval = 1.0 / rate_per_s
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel: threading.Event | None = None) -> bool:
+        """Block until a slot is free; return False as soon as `cancel` is set."""
+        while True:
+            if cancel is not None and cancel.is_set():
+                return False
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._next:
+                    self._next = now + self.interval
+                    return True
+                wait = self._next - now
+            if cancel is not None:
+                cancel.wait(wait)
+            else:
+                time.sleep(wait)
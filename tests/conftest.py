@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.app.jobs import FINISHED, Job, JobManager
+from src.core.entities import Place
+from src.core.errors import JobCancelled
+from src.infrastructure.persistence.sqlite.place_repository import SQLitePlaceRepository
+from src.infrastructure.providers.places.client import PlacesV1Client
+from src.utils.rate_limit import RateLimiter
+
+
+class FakeProvider:
+    """PlacesProvider stand-in: `results` maps a query to the place_ids it returns.
+
+    While `gate` is clear, every call blocks on it, which lets tests observe
+    running jobs and cancel them mid-flight.
+    """
+
+    def __init__(self, results: dict[str, list[str]] | None = None):
+        self.results = results or {}
+        self.gate = threading.Event()
+        self.gate.set()
+        self.searches: list[str] = []
+        self.details: list[str] = []
+        self._lock = threading.Lock()
+
+    def _enter(self, cancel) -> None:
+        self.gate.wait()
+        if cancel is not None and cancel.is_set():
+            raise JobCancelled("cancelled")
+
+    def text_search(self, *, query, location, radius_m, types, max_results, cancel=None):
+        self._enter(cancel)
+        with self._lock:
+            self.searches.append(query)
+        if query == "boom":
+            raise RuntimeError("search failed")
+        ids = self.results.get(query, [])[:max_results]
+        return [Place(place_id=pid, name=pid) for pid in ids]
+
+    def nearby_grid_search(self, *, cancel=None, **kwargs):
+        self._enter(cancel)
+        return [Place(place_id=pid, name=pid) for pid in self.results.get("nearby", [])]
+
+    def place_details(self, place_id: str, *, cancel=None) -> Place:
+        self._enter(cancel)
+        with self._lock:
+            self.details.append(place_id)
+        return Place(place_id=place_id, name=f"name-{place_id}", website=f"https://{place_id}")
+
+
+class FakeResponse:
+    def __init__(self, data: dict, status_code: int = 200):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self) -> dict:
+        return self._data
+
+
+class FakeSession:
+    """Stands in for requests.Session under the real PlacesV1Client.
+
+    Text searches return one place per page and `pages` pages per query; nearby
+    searches return one place per grid cell. Every request is timestamped in `log`.
+    """
+
+    def __init__(self, pages: int = 1):
+        self.pages = pages
+        self.log: list[tuple[float, str, str]] = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, *, headers=None, json=None, timeout=None):
+        with self._lock:
+            self.log.append((time.monotonic(), method, url))
+        if url.endswith(":searchText"):
+            page = int(json.get("pageToken") or 0)
+            data = {"places": [{"name": f"places/{json['textQuery']}-{page}"}]}
+            if page + 1 < self.pages:
+                data["nextPageToken"] = str(page + 1)
+            return FakeResponse(data)
+        if url.endswith(":searchNearby"):
+            c = json["locationRestriction"]["circle"]["center"]
+            return FakeResponse({"places": [{"name": f"places/{c['latitude']},{c['longitude']}"}]})
+        place_id = url.rsplit("/", 1)[1]
+        return FakeResponse({"displayName": {"text": place_id}, "websiteUri": None})
+
+
+def make_client(session: FakeSession, rate_per_s: float | None = None) -> PlacesV1Client:
+    client = PlacesV1Client(
+        session=session, limiter=RateLimiter(rate_per_s) if rate_per_s else None
+    )
+    client.PAGE_DELAY_S = client.NEARBY_PAGE_DELAY_S = client.CELL_DELAY_S = 0
+    return client
+
+
+class FakeScraper:
+    def __init__(self):
+        self.sites: list[str] = []
+
+    def get_email_from_site(self, website_url: str) -> str | None:
+        self.sites.append(website_url)
+        return f"info@{website_url.removeprefix('https://')}.test"
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    r = SQLitePlaceRepository(str(tmp_path / "places.db"))
+    yield r
+    r.close()
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider()
+
+
+@pytest.fixture
+def scraper():
+    return FakeScraper()
+
+
+@pytest.fixture
+def manager(repo, provider, scraper):
+    m = JobManager(repo, provider, scraper, max_jobs=1)
+    yield m
+    provider.gate.set()
+    m.shutdown()
+
+
+def wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def wait_finished(job: Job, timeout: float = 5.0) -> Job:
+    wait_for(lambda: job.status in FINISHED, timeout)
+    return job
@@ -0,0 +1,35 @@
+import threading
+import time
+
+import pytest
+
+from src.app.use_cases.collect_batch import CollectBatchUseCase, TextQuerySpec
+from src.core.errors import JobCancelled
+from src.utils.rate_limit import RateLimiter
+from tests.conftest import FakeSession, make_client
+
+
+def test_cancel_does_not_wait_for_queued_rate_slots(repo):
+    session = FakeSession()
+    client = make_client(session, rate_per_s=5)
+    specs = [TextQuerySpec(query=f"q{i}") for i in range(60)]
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+
+    started = time.monotonic()
+    with pytest.raises(JobCancelled):
+        CollectBatchUseCase(repo, client).run(specs, cancel=cancel)
+
+    assert time.monotonic() - started < 1.0
+    assert len(session.log) < 5
+
+
+def test_rate_limiter_acquire_returns_false_once_cancelled():
+    limiter = RateLimiter(0.1)
+    assert limiter.acquire()
+    cancel = threading.Event()
+    threading.Timer(0.05, cancel.set).start()
+
+    started = time.monotonic()
+    assert not limiter.acquire(cancel)
+    assert time.monotonic() - started < 1.0
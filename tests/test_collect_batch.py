@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+from src.app.use_cases.collect_batch import CollectBatchUseCase, TextQuerySpec
+from src.core.entities import Place
+from tests.conftest import FakeSession, make_client
+
+
+def test_dedupes_across_queries_and_against_repo(repo, provider):
+    provider.results = {"a": ["1", "2", "3"], "b": ["2", "3", "4"]}
+    repo.upsert(Place(place_id="3", name="stored"))
+
+    uc = CollectBatchUseCase(repo, provider)
+    places, summaries = uc.run([TextQuerySpec(query="a"), TextQuerySpec(query="b")])
+
+    assert sorted(provider.details) == ["1", "2", "4"]
+    assert sorted(p.place_id for p in places) == ["1", "2", "4"]
+    a, b = summaries
+    assert (a.hits, a.new, a.duplicates, a.known) == (3, 2, 0, 1)
+    assert (b.hits, b.new, b.duplicates, b.known) == (3, 1, 2, 0)
+    assert all(repo.is_known(pid) for pid in ["1", "2", "4"])
+
+
+def test_failed_query_does_not_abort_batch(repo, provider):
+    provider.results = {"a": ["1"]}
+
+    _, summaries = CollectBatchUseCase(repo, provider).run(
+        [TextQuerySpec(query="boom"), TextQuerySpec(query="a")]
+    )
+
+    assert summaries[0].error == "search failed"
+    assert summaries[1].new == 1
+
+
+def test_rate_counts_every_page_not_every_query(repo):
+    # 8 queries x 6 pages, then one details call per place: 96 requests in all
+    session = FakeSession(pages=6)
+    specs = [TextQuerySpec(query=f"q{i}") for i in range(8)]
+
+    places, _ = CollectBatchUseCase(repo, make_client(session, rate_per_s=50), max_workers=8).run(
+        specs
+    )
+
+    assert len(places) == 48
+    stamps = [t for t, _, _ in session.log]
+    assert len(stamps) == 96
+    assert max(stamps) - min(stamps) >= 95 / 50 * 0.95
+
+
+def test_failed_upsert_stops_queued_calls(repo, monkeypatch):
+    session = FakeSession()
+    specs = [TextQuerySpec(query=f"q{i}") for i in range(10)]
+
+    def upsert(place):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(repo, "upsert", upsert)
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="disk full"):
+        CollectBatchUseCase(repo, make_client(session, rate_per_s=20), max_workers=8).run(specs)
+
+    # 10 searches + the first details call; the other 9 never reach the API
+    assert len(session.log) <= 12
+    assert time.monotonic() - started < 0.8
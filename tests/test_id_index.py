@@ -0,0 +1,54 @@
+from src.core.entities import Place
+from src.infrastructure.persistence.sqlite.place_repository import SQLitePlaceRepository
+from src.utils.id_index import _MIN_SLOTS, PlaceIdIndex
+
+
+def test_grows_past_min_slots_and_keeps_every_id():
+    ids = [f"ChIJ{i:08d}" for i in range(3 * _MIN_SLOTS)]
+    index = PlaceIdIndex()
+    assert index.nbytes == 8 * _MIN_SLOTS
+
+    assert all(index.add(pid) for pid in ids)
+    assert not index.add(ids[0])
+
+    assert len(index) == len(ids)
+    assert index.nbytes == 8 * 8 * _MIN_SLOTS  # doubled until at most half full
+    assert all(pid in index for pid in ids)
+    assert not any(f"other{i}" in index for i in range(3 * _MIN_SLOTS))
+
+
+def test_capacity_presizes_the_table():
+    index = PlaceIdIndex(capacity=5000)
+    assert index.nbytes == 8 * 16384  # smallest power of two >= 2 * capacity
+    assert len(index) == 0
+
+    index = PlaceIdIndex((f"p{i}" for i in range(5000)), capacity=5000)
+    assert index.nbytes == 8 * 16384  # no rehash while filling
+    assert len(index) == 5000
+    assert 16 <= index.nbytes / len(index) <= 32
+
+
+def test_repo_loads_index_lazily_from_existing_rows(tmp_path):
+    path = str(tmp_path / "places.db")
+    first = SQLitePlaceRepository(path)
+    for pid in ["a", "b", "c"]:
+        first.upsert(Place(place_id=pid, name=pid))
+    first.close()
+
+    repo = SQLitePlaceRepository(path)
+    try:
+        assert repo._known is None
+        assert repo.is_known("b")
+        assert not repo.is_known("d")
+        assert len(repo.known_ids) == 3
+    finally:
+        repo.close()
+
+
+def test_upsert_after_load_is_visible(repo):
+    assert not repo.is_known("new")  # loads the (empty) index
+
+    repo.upsert(Place(place_id="new", name="new"))
+
+    assert repo.is_known("new")
+    assert len(repo.known_ids) == 1
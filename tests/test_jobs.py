@@ -0,0 +1,141 @@
+import time
+
+import pytest
+
+from src.app.jobs import CANCELLED, DONE, QUEUED, RUNNING, JobManager
+from src.core.entities import Place
+from tests.conftest import FakeSession, make_client, wait_finished, wait_for
+
+
+def test_collect_text_job_lifecycle(manager, provider, scraper):
+    provider.results = {"salon": ["1", "2"]}
+    provider.gate.clear()
+
+    job = manager.submit("collect-text", {"query": "salon"})
+    wait_for(lambda: job.status == RUNNING)
+    assert job.started_at is not None and job.finished_at is None
+
+    provider.gate.set()
+    wait_finished(job)
+
+    assert job.status == DONE
+    assert job.result == {
+        "new": 2,
+        "emails": {"1": "info@1.test", "2": "info@2.test"},
+    }
+    assert (job.phase, job.done, job.total) == ("enrich", 2, 2)
+    assert job.to_dict()["progress"] == {"phase": "enrich", "done": 2, "total": 2}
+
+
+def test_collect_batch_job_reports_per_query_summaries(manager, provider):
+    provider.results = {"a": ["1", "2"], "b": ["2", "3"]}
+
+    job = wait_finished(
+        manager.submit(
+            "collect-batch", {"queries": [{"query": "a"}, {"query": "b"}], "enrich": False}
+        )
+    )
+
+    assert job.status == DONE
+    assert job.result["new"] == 3
+    assert [q["duplicates"] for q in job.result["queries"]] == [0, 1]
+    assert "emails" not in job.result
+
+
+def test_enrich_job(manager, repo, scraper):
+    repo.upsert(Place(place_id="p1", name="p1", website="https://p1"))
+
+    job = wait_finished(manager.submit("enrich", {"place_ids": ["p1", "missing"]}))
+
+    assert job.status == DONE
+    assert job.result == {"emails": {"p1": "info@p1.test"}}
+    assert repo.get_by_id("p1").email == "info@p1.test"
+
+
+def test_cancel_queued_job_never_runs(manager, provider):
+    provider.results = {"first": ["1"], "second": ["2"]}
+    provider.gate.clear()
+    first = manager.submit("collect-text", {"query": "first"})
+    second = manager.submit("collect-text", {"query": "second"})
+    wait_for(lambda: first.status == RUNNING)
+    assert second.status == QUEUED
+
+    manager.cancel(second.id)
+    finished_at = second.finished_at
+    provider.gate.set()
+    wait_finished(first)
+    time.sleep(0.05)
+
+    assert second.status == CANCELLED
+    assert second.started_at is None and second.finished_at == finished_at
+    assert "second" not in provider.searches
+
+
+def test_cancel_running_batch_is_prompt(repo, scraper):
+    session = FakeSession()
+    manager = JobManager(repo, make_client(session, rate_per_s=2), scraper)
+    try:
+        queries = [{"query": f"q{i}"} for i in range(200)]
+        job = manager.submit("collect-batch", {"queries": queries})
+        wait_for(lambda: job.status == RUNNING and job.done > 0)
+
+        started = time.monotonic()
+        manager.cancel(job.id)
+        wait_finished(job, timeout=2.0)
+
+        assert job.status == CANCELLED
+        assert time.monotonic() - started < 1.0
+        assert len(session.log) < 10
+    finally:
+        manager.shutdown()
+
+
+def test_jobs_share_one_per_request_rate_budget(repo, scraper):
+    session = FakeSession(pages=3)
+    rate = 20
+    manager = JobManager(repo, make_client(session, rate_per_s=rate), scraper, max_jobs=3)
+    try:
+        jobs = [
+            manager.submit("collect-text", {"query": "a", "enrich": False}),
+            manager.submit("collect-batch", {"queries": [{"query": "b"}], "enrich": False}),
+            manager.submit(
+                "collect-nearby",
+                {"location": "40.4,-3.7", "radius": 1000, "types": "cafe", "enrich": False},
+            ),
+        ]
+        for job in jobs:
+            assert wait_finished(job, timeout=10).status == DONE
+    finally:
+        manager.shutdown()
+
+    # pages, grid cells and details from all three jobs are spaced by one budget
+    stamps = sorted(t for t, _, _ in session.log)
+    assert len(stamps) > 20
+    assert stamps[-1] - stamps[0] >= (len(stamps) - 1) / rate * 0.95
+
+
+@pytest.mark.parametrize(
+    ("kind", "params"),
+    [
+        ("unknown", {}),
+        ("collect-text", {}),
+        ("collect-text", [1]),
+        ("collect-text", {"query": "a", "radius": "far"}),
+        ("collect-text", {"query": "a", "radius": 0}),
+        ("collect-text", {"query": "a", "max": -5}),
+        ("collect-text", {"query": "a", "enrich": "false"}),
+        ("collect-batch", {"queries": []}),
+        ("collect-batch", {"queries": [{"query": "a"}, {}]}),
+        ("collect-batch", {"queries": [{"query": "a"}], "workers": 0}),
+        ("collect-batch", {"queries": [{"query": "a", "max": 0}]}),
+        ("collect-batch", {"queries": [{"query": "a"}], "enrich": 0}),
+        ("collect-nearby", {"location": "x,y", "radius": 100, "types": "cafe"}),
+        ("collect-nearby", {"location": "1,2", "types": "cafe"}),
+        ("collect-nearby", {"location": "1,2", "radius": 100}),
+        ("enrich", {"place_ids": "p1"}),
+    ],
+)
+def test_submit_rejects_invalid_params(manager, kind, params):
+    with pytest.raises((ValueError, TypeError)):
+        manager.submit(kind, params)
+    assert manager.list_jobs() == []
@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from src.core.errors import JobCancelled
+from src.utils.rate_limit import RateLimiter
+from tests.conftest import FakeSession, make_client
+
+
+class CountingLimiter(RateLimiter):
+    def __init__(self, rate_per_s: float):
+        super().__init__(rate_per_s)
+        self.acquired = 0
+
+    def acquire(self, cancel=None) -> bool:
+        ok = super().acquire(cancel)
+        self.acquired += ok
+        return ok
+
+
+def test_every_text_search_page_takes_a_rate_slot():
+    session = FakeSession(pages=6)
+    client = make_client(session, rate_per_s=20)
+
+    started = time.monotonic()
+    places = client.text_search(query="q", location=None, radius_m=None, types=None)
+
+    assert len(places) == 6
+    assert len(session.log) == 6
+    assert time.monotonic() - started >= 5 / 20 * 0.95
+
+
+def test_every_grid_cell_takes_a_rate_slot():
+    session = FakeSession()
+    client = make_client(session)
+    client.limiter = limiter = CountingLimiter(1000)
+
+    client.nearby_grid_search(
+        center_lat=40.4, center_lng=-3.7, radius_m=1000, types=["cafe"], cell_radius_m=600
+    )
+
+    assert limiter.acquired == len(session.log) == 25  # 5x5 grid, one page per cell
+
+
+def test_backoff_retries_take_rate_slots(monkeypatch):
+    session = FakeSession()
+    client = make_client(session)
+    client.limiter = limiter = CountingLimiter(1000)
+    real_request = session.request
+    failures = iter([requests.ConnectionError("reset")])
+
+    def flaky(*args, **kwargs):
+        for exc in failures:
+            raise exc
+        return real_request(*args, **kwargs)
+
+    monkeypatch.setattr(session, "request", flaky)
+
+    client.place_details("p1")
+
+    assert limiter.acquired == 2
+
+
+def test_cancel_interrupts_wait_for_rate_slot():
+    session = FakeSession(pages=10)
+    client = make_client(session, rate_per_s=2)
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+
+    started = time.monotonic()
+    with pytest.raises(JobCancelled):
+        client.text_search(query="q", location=None, radius_m=None, types=None, cancel=cancel)
+
+    assert time.monotonic() - started < 1.0
+    assert len(session.log) == 1
+
+
+def test_cancel_interrupts_page_delay():
+    session = FakeSession(pages=3)
+    client = make_client(session)
+    client.PAGE_DELAY_S = 30
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+
+    with pytest.raises(JobCancelled):
+        client.text_search(query="q", location=None, radius_m=None, types=None, cancel=cancel)
+    assert len(session.log) == 1
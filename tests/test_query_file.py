@@ -0,0 +1,29 @@
+import pytest
+
+from src.app.use_cases.collect_batch import TextQuerySpec
+from src.interface.query_file import load_query_specs
+
+
+def test_load_query_specs_reports_line_numbers(tmp_path):
+    good = tmp_path / "q.csv"
+    good.write_text('query,location,radius,types\nsalon," 40.4,-3.7 ",500,"a, b"\n')
+    [spec] = load_query_specs(str(good))
+    assert spec == TextQuerySpec(
+        query="salon", location="40.4,-3.7", radius_m=500, types=["a", "b"]
+    )
+
+    bad = tmp_path / "q.jsonl"
+    bad.write_text('{"query": "a"}\n\n{"query": "b", "max": "lots"}\n')
+    with pytest.raises(ValueError, match=r"q\.jsonl:3: invalid 'max'"):
+        load_query_specs(str(bad))
+
+
+@pytest.mark.parametrize(
+    ("name", "text"),
+    [("q.csv", "query,max\nsalon,5\n"), ("q.jsonl", '{"query": "salon", "max": 5}\n')],
+)
+def test_load_query_specs_skips_utf8_bom(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_bytes(b"\xef\xbb\xbf" + text.encode("utf-8"))
+
+    assert load_query_specs(str(path)) == [TextQuerySpec(query="salon", max_results=5)]
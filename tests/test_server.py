@@ -0,0 +1,130 @@
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from src.app.jobs import CANCELLED, DONE
+from src.core.entities import Place
+from src.interface.server import make_server
+from tests.conftest import wait_finished, wait_for
+
+
+@pytest.fixture
+def server(manager):
+    srv = make_server(manager, port=0)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def request(server, method, path, body=None):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+    payload = body if isinstance(body, (bytes, type(None))) else json.dumps(body)
+    conn.request(method, path, payload)
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read())
+
+
+def test_health(server, manager, repo):
+    repo.upsert(Place(place_id="p1", name="stored"))
+
+    status, body = request(server, "GET", "/health")
+
+    assert status == 200
+    assert body == {
+        "status": "ok",
+        "kinds": manager.kinds,
+        "known_ids": {"count": 1, "bytes": repo.known_ids.nbytes},
+    }
+
+
+def test_submit_poll_and_list(server, manager, provider):
+    provider.results = {"salon": ["1"]}
+
+    status, body = request(
+        server, "POST", "/jobs", {"kind": "collect-text", "params": {"query": "salon"}}
+    )
+    assert status == 202
+    wait_finished(manager.get(body["id"]))
+
+    status, job = request(server, "GET", f"/jobs/{body['id']}")
+    assert status == 200
+    assert job["status"] == DONE
+    assert job["result"]["new"] == 1
+    assert [j["id"] for j in request(server, "GET", "/jobs")[1]] == [body["id"]]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"kind": "collect-text", "params": {}},
+        {"kind": "collect-text", "params": [1]},
+        {"kind": "nope"},
+        [1, 2],
+        b"{not json",
+    ],
+)
+def test_bad_submissions_are_400(server, manager, body):
+    status, resp = request(server, "POST", "/jobs", body)
+    assert status == 400
+    assert "error" in resp
+    assert manager.list_jobs() == []
+
+
+@pytest.mark.parametrize(
+    ("method", "path"), [("GET", "/jobs/zzz"), ("DELETE", "/jobs/zzz"), ("GET", "/nope")]
+)
+def test_unknown_paths_are_404(server, method, path):
+    assert request(server, method, path)[0] == 404
+
+
+@pytest.mark.parametrize(("method", "suffix"), [("DELETE", ""), ("POST", "/cancel")])
+def test_cancel_over_http(server, manager, provider, method, suffix):
+    provider.results = {"a": ["1", "2"]}
+    provider.gate.clear()
+    _, body = request(server, "POST", "/jobs", {"kind": "collect-text", "params": {"query": "a"}})
+    job = manager.get(body["id"])
+    wait_for(lambda: job.status == "running")
+
+    status, _ = request(server, method, f"/jobs/{job.id}{suffix}")
+    provider.gate.set()
+
+    assert status == 200
+    assert wait_finished(job).status == CANCELLED
+    assert provider.details == []
+
+
+def test_unix_socket_refuses_to_replace_regular_file(manager, tmp_path):
+    db = tmp_path / "places.db"
+    db.write_text("data")
+
+    with pytest.raises(FileExistsError):
+        make_server(manager, socket_path=str(db))
+    assert db.read_text() == "data"
+
+
+def test_unix_socket_serves_and_cleans_up(manager, tmp_path):
+    path = tmp_path / "places.sock"
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(path))
+    stale.close()
+
+    srv = make_server(manager, socket_path=str(path))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        client = socket.socket(socket.AF_UNIX)
+        client.connect(str(path))
+        client.sendall(b"GET /health HTTP/1.0\r\n\r\n")
+        data = b""
+        while chunk := client.recv(65536):
+            data += chunk
+        client.close()
+        assert data.startswith(b"HTTP/1.0 200")
+    finally:
+        srv.shutdown()
+        srv.server_close()
+    assert not path.exists()